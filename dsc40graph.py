@@ -1,5 +1,12 @@
 """Efficient undirected and directed graph data structures."""
 
+from array import array
+import bisect
+import collections
+import functools
+import itertools
+import operator
+
 
 MAX_NODES_DISPLAYED = 20
 MAX_EDGES_DISPLAYED = 10
@@ -13,16 +20,44 @@ class DoesNotExistError(Error):
     """The node/edge does not exist."""
 
 
-def _take(iterable, n):
-    for i, x in enumerate(iterable):
-        if i >= n:
-            break
-        yield x
+# a graph's compressed sparse row snapshot, made by freeze(). iter_edges is a
+# zero-argument callable returning an iterator over the graph's edges
+_CSR = collections.namedtuple("_CSR", ["nodes", "indptr", "neighbors", "iter_edges"])
+
+
+def _iter_csr_rows(nodes, neighbors, starts, ends):
+    """Iterate over (u, v) for every v in neighbors[start:end] of each row u.
+
+    Like the dict-based edge iterators, this is composed purely of builtins so
+    that no Python code runs per edge.
+
+    """
+    rows = map(neighbors.__getitem__, map(slice, starts, ends))
+    labels = map(map, itertools.repeat(nodes.__getitem__), rows)
+    return itertools.chain.from_iterable(map(zip, map(itertools.repeat, nodes), labels))
+
+
+def _iter_bits(mask):
+    """Iterate over the positions of the set bits of `mask`, lowest first."""
+    while mask:
+        lowest = mask & -mask
+        yield lowest.bit_length() - 1
+        mask ^= lowest
+
+
+try:
+    _bit_count = int.bit_count
+except AttributeError:  # Python < 3.10
+
+    def _bit_count(mask):
+        return bin(mask).count("1")
 
 
 class _NodesView:
     """A view into a graph's nodes."""
 
+    __slots__ = ("_nodes",)
+
     def __init__(self, nodes):
         self._nodes = nodes
 
@@ -34,14 +69,14 @@ class _NodesView:
         return len(self._nodes)
 
     def __iter__(self):
-        yield from self._nodes
+        return iter(self._nodes)
 
     def __repr__(self):
         limit = MAX_NODES_DISPLAYED
         over_limit = len(self._nodes) > limit
 
         if over_limit:
-            nodes_to_print = list(_take(self._nodes, MAX_NODES_DISPLAYED))
+            nodes_to_print = list(itertools.islice(self._nodes, MAX_NODES_DISPLAYED))
             suffix = "..."
         else:
             nodes_to_print = self._nodes
@@ -54,9 +89,11 @@ class _NodesView:
 class _EdgeView:
     """Base class for views into a graph's edges."""
 
-    def __init__(self, adj, number_of_edges):
+    __slots__ = ("_adj", "_graph")
+
+    def __init__(self, adj, graph):
         self._adj = adj
-        self._number_of_edges = number_of_edges
+        self._graph = graph
 
     def __contains__(self, edge):
         """Perform an edge query.
@@ -64,24 +101,22 @@ class _EdgeView:
         Average case time complexity: Theta(1)
         """
         u, v = edge
-        try:
-            return v in self._adj[u]
-        except KeyError:
-            return False
+        neighbors = self._adj.get(u)
+        return neighbors is not None and v in neighbors
 
     def __len__(self):
         """The number of edges.
 
         Average case time complexity: Theta(1)
         """
-        return self._number_of_edges
+        return self._graph._number_of_edges
 
     def __repr__(self):
         limit = MAX_EDGES_DISPLAYED
         over_limit = len(self) > limit
 
         if over_limit:
-            edges_to_print = list(_take(self, MAX_EDGES_DISPLAYED))
+            edges_to_print = list(itertools.islice(self, MAX_EDGES_DISPLAYED))
             suffix = "..."
         else:
             edges_to_print = list(self)
@@ -94,12 +129,16 @@ class _EdgeView:
 class _UndirectedEdgeView(_EdgeView):
     """A view into an undirected graph's edges."""
 
+    __slots__ = ()
+
     def __iter__(self):
         """Iterate through the edges.
 
         Each edge in the graph is yielded exactly once as a pair whose order is
         arbitrary. That is, suppose that a graph has an edge between node 1 and
         node 2. Then the pair (1,2) may be yielded, or (2,1), but not both.
+        Which pair is yielded, and the order of the edges, depend only on the
+        order in which nodes and edges were added.
 
         Yields
         ------
@@ -107,19 +146,47 @@ class _UndirectedEdgeView(_EdgeView):
             The edge as a pair of labels.
 
         """
-        seen = set()
+        csr = self._graph._csr
+        if csr is not None:
+            return csr.iter_edges()
+        return self._iter_adj()
+
+    def _iter_adj(self):
+        # each edge is stored twice, once in each direction. we emit only the
+        # direction whose source comes first in adj, by skipping neighbors
+        # that have already been visited. unlike comparing hashes, this does
+        # not depend on the interpreter's hash seed, and the set of visited
+        # nodes grows lazily, so the first edge is found without a full pass
+        done = set()
 
         for u, neighbors in self._adj.items():
             for v in neighbors:
-                edge = frozenset((u, v))
-                if edge not in seen:
-                    seen.add(edge)
+                if v not in done:
                     yield (u, v)
-                else:
-                    continue
+            done.add(u)
+
+    @staticmethod
+    def _row_bounds(indptr, neighbors):
+        """The part of each CSR row that edge iteration should walk."""
+        # each edge appears in the rows of both of its nodes; rows are sorted,
+        # so row i is cut to start after the neighbors whose index is <= i
+        ends = indptr[1:]
+        starts = array(
+            "q",
+            map(
+                bisect.bisect_right,
+                itertools.repeat(neighbors),
+                range(len(ends)),
+                indptr,
+                ends,
+            ),
+        )
+        return starts, ends
 
 
 class _DirectedEdgeView(_EdgeView):
+    __slots__ = ()
+
     def __iter__(self):
         """Iterate through the edges.
 
@@ -129,18 +196,93 @@ class _DirectedEdgeView(_EdgeView):
             The edge as an ordered pair of labels.
 
         """
-        for u, neighbors in self._adj.items():
-            for v in neighbors:
-                yield (u, v)
+        csr = self._graph._csr
+        if csr is not None:
+            return csr.iter_edges()
+        return self._iter_adj()
+
+    def _iter_adj(self):
+        # equivalent to yielding (u, v) for every u and every v in adj[u], but
+        # built entirely from builtins so that no Python code runs per edge.
+        # a dict's keys and values are guaranteed to iterate in the same order
+        adj = self._adj
+        return itertools.chain.from_iterable(
+            map(zip, map(itertools.repeat, adj), adj.values())
+        )
+
+    @staticmethod
+    def _row_bounds(indptr, neighbors):
+        """The part of each CSR row that edge iteration should walk."""
+        return indptr[:-1], indptr[1:]
+
+
+class _UndirectedIntEdgeView(_UndirectedEdgeView):
+    """A view into the edges of an undirected graph stored as bitsets."""
+
+    __slots__ = ()
+
+    def __contains__(self, edge):
+        """Perform an edge query.
+
+        Average case time complexity: Theta(1)
+        """
+        u, v = edge
+        mask = self._adj.get(u)
+        if mask is None:
+            return False
+        try:
+            v = operator.index(v)
+        except TypeError:
+            return False
+        return v >= 0 and bool((mask >> v) & 1)
+
+    def _iter_adj(self):
+        # emit each edge from its smaller endpoint only
+        for u, mask in self._adj.items():
+            first = u + 1
+            for offset in _iter_bits(mask >> first):
+                yield (u, first + offset)
 
 
 class _Graph:
     """Base class for graph data structures."""
 
+    __slots__ = (
+        "adj",
+        "_number_of_edges",
+        "_csr",
+        "_nodes_view",
+        "_edges_view",
+        "__weakref__",
+    )
+
+    # the attributes that are copied and pickled; the views are rebuilt
+    _state_attributes = ("adj", "_number_of_edges", "_csr")
+
     def __init__(self, _edge_view_factory):
         self.adj = dict()
         self._number_of_edges = 0
-        self._edge_view_factory = _edge_view_factory
+
+        # compressed sparse row copy of adj built by freeze(); discarded
+        # whenever the graph is modified
+        self._csr = None
+
+        self._build_views(_edge_view_factory)
+
+    def _build_views(self, edge_view_factory):
+        # the views are live, so they can be built once and reused
+        self._nodes_view = _NodesView(self.adj)
+        self._edges_view = edge_view_factory(self.adj, self)
+
+    def __getstate__(self):
+        attributes = {name: getattr(self, name) for name in self._state_attributes}
+        return type(self._edges_view), attributes
+
+    def __setstate__(self, state):
+        edge_view_factory, attributes = state
+        for name, value in attributes.items():
+            setattr(self, name, value)
+        self._build_views(edge_view_factory)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} with {len(self.nodes)} nodes and {len(self.edges)} edges>"
@@ -159,8 +301,124 @@ class _Graph:
             The label of the node.
 
         """
-        if label not in self.nodes:
-            self.adj[label] = set()
+        if label not in self.adj:
+            self._csr = None
+            self.adj[label] = {}
+
+    def freeze(self):
+        """Build a compact, read-only copy of the graph for fast iteration.
+
+        The nodes are numbered in the order they appear in the graph, and the
+        neighbors of every node are stored as a sorted run of node numbers in
+        one contiguous array (the "compressed sparse row" layout). Until the
+        graph is next modified, iterating over its edges walks these arrays
+        instead of the adjacency dicts.
+
+        This is worthwhile when a graph is built once and then traversed many
+        times. Any call that modifies the graph discards the compact copy;
+        call this method again to rebuild it.
+
+        Takes O(V + E log E) time.
+
+        Example
+        -------
+        >>> graph = DirectedGraph()
+        >>> graph.add_edge(1, 2)
+        >>> graph.add_edge(1, 3)
+        >>> graph.freeze()
+        >>> sorted(graph.edges)
+        [(1, 2), (1, 3)]
+
+        """
+        nodes, indptr, neighbors = self._build_csr(list(self.adj))
+
+        # everything that does not depend on the iteration itself, such as
+        # where each row starts, is worked out once here and bound to the
+        # iterator
+        starts, ends = self._edges_view._row_bounds(indptr, neighbors)
+        iter_edges = functools.partial(_iter_csr_rows, nodes, neighbors, starts, ends)
+        self._csr = _CSR(nodes, indptr, neighbors, iter_edges)
+
+    def to_csr(self, node_order=None):
+        """Export the graph's adjacency structure as NumPy arrays.
+
+        The result is in compressed sparse row (CSR) layout: the neighbors of
+        the node numbered i are ``indices[indptr[i]:indptr[i + 1]]``, sorted in
+        increasing order. For a directed graph these are the node's
+        successors. For an undirected graph every edge appears in the rows of
+        both of its nodes.
+
+        The arrays can be handed to SciPy, for instance as
+        ``scipy.sparse.csr_matrix((numpy.ones(len(indices)), indices, indptr))``.
+
+        Requires NumPy. Takes O(V + E log E) time.
+
+        Parameters
+        ----------
+        node_order
+            An optional sequence containing every node of the graph exactly
+            once. Node ``node_order[i]`` is numbered i. If not given, the nodes
+            are numbered in the order they appear in the graph.
+
+        Returns
+        -------
+        nodes : list
+            The node labels; ``nodes[i]`` is the node numbered i.
+        indptr : numpy.ndarray
+            An int64 array of length ``len(nodes) + 1`` of row offsets.
+        indices : numpy.ndarray
+            An int64 array of the neighbors' node numbers.
+
+        Raises
+        ------
+        ValueError
+            If ``node_order`` does not contain every node exactly once.
+
+        Example
+        -------
+        >>> graph = DirectedGraph()
+        >>> graph.add_edge('a', 'b')
+        >>> graph.add_edge('a', 'c')
+        >>> graph.add_edge('c', 'a')
+        >>> nodes, indptr, indices = graph.to_csr()
+        >>> nodes
+        ['a', 'b', 'c']
+        >>> indptr
+        array([0, 2, 2, 3])
+        >>> indices
+        array([1, 2, 0])
+
+        """
+        import numpy as np
+
+        if node_order is None and self._csr is not None:
+            nodes, indptr, neighbors, _ = self._csr
+        else:
+            if node_order is None:
+                nodes = list(self.adj)
+            else:
+                nodes = list(node_order)
+                if len(nodes) != len(self.adj) or set(nodes) != self.adj.keys():
+                    raise ValueError("node_order must contain every node exactly once.")
+            nodes, indptr, neighbors = self._build_csr(nodes)
+
+        return (
+            list(nodes),
+            np.array(indptr, dtype=np.int64),
+            np.array(neighbors, dtype=np.int64),
+        )
+
+    def _build_csr(self, nodes):
+        """Flatten adj into CSR arrays, numbering the nodes as in `nodes`."""
+        index = {node: i for i, node in enumerate(nodes)}
+        indptr = array("q", [0])
+        neighbors = array("q")
+
+        for node in nodes:
+            neighbors.extend(sorted(index[v] for v in self.neighbors(node)))
+            indptr.append(len(neighbors))
+
+        return nodes, indptr, neighbors
 
     @property
     def nodes(self):
@@ -182,7 +440,7 @@ class _Graph:
         3
 
         """
-        return _NodesView(self.adj.keys())
+        return self._nodes_view
 
     def arbitrary_node(self):
         """Return an arbitrary graph node. How the node is chosen is undefined.
@@ -204,10 +462,9 @@ class _Graph:
         2
 
         """
-        try:
-            return next(iter(self.nodes))
-        except StopIteration:
-            raise DoesNotExistError("The graph is empty.")
+        for label in self.adj:
+            return label
+        raise DoesNotExistError("The graph is empty.")
 
     @property
     def edges(self):
@@ -228,10 +485,12 @@ class _Graph:
         False
         
         """
-        return self._edge_view_factory(self.adj, self._number_of_edges)
+        return self._edges_view
 
 
 class UndirectedGraph(_Graph):
+    __slots__ = ()
+
     def __init__(self, _edge_view_factory=_UndirectedEdgeView):
         super().__init__(_edge_view_factory)
 
@@ -263,15 +522,71 @@ class UndirectedGraph(_Graph):
         if u_label == v_label:
             raise ValueError("Undirected graphs have no self loops.")
 
-        for x in {u_label, v_label}:
-            if x not in self.adj:
-                self.adj[x] = set()
+        adj = self.adj
+        neighbors_u = adj.setdefault(u_label, {})
+        neighbors_v = adj.setdefault(v_label, {})
 
-        if (u_label, v_label) not in self.edges:
-            self.adj[u_label].add(v_label)
-            self.adj[v_label].add(u_label)
+        # a node is only ever created here together with a new edge
+        if v_label not in neighbors_u:
+            self._csr = None
+            neighbors_u[v_label] = None
+            neighbors_v[u_label] = None
             self._number_of_edges += 1
 
+    def add_edges_from(self, edges):
+        """Add several undirected edges to the graph at once.
+
+        Equivalent to calling :meth:`add_edge` on each pair, but faster when
+        loading many edges.
+
+        Average case time complexity: Theta(# of edges given).
+
+        Parameters
+        ----------
+        edges
+            An iterable of pairs of node labels.
+
+        Raises
+        ------
+        ValueError
+            If one of the edges is a self-loop. The edges before it will have
+            been added.
+
+        Example
+        -------
+        >>> graph = UndirectedGraph()
+        >>> graph.add_edges_from([(1, 2), (2, 3), (3, 1)])
+        >>> len(graph.edges)
+        3
+
+        """
+        adj = self.adj
+        number_of_edges = self._number_of_edges
+
+        try:
+            for u_label, v_label in edges:
+                if u_label == v_label:
+                    raise ValueError("Undirected graphs have no self loops.")
+
+                neighbors_u = adj.get(u_label)
+                if neighbors_u is None:
+                    neighbors_u = adj[u_label] = {}
+
+                neighbors_v = adj.get(v_label)
+                if neighbors_v is None:
+                    neighbors_v = adj[v_label] = {}
+
+                if v_label not in neighbors_u:
+                    neighbors_u[v_label] = None
+                    neighbors_v[u_label] = None
+                    number_of_edges += 1
+        finally:
+            # nodes are only created together with new edges, so the graph
+            # changed exactly when the edge count did
+            if number_of_edges != self._number_of_edges:
+                self._csr = None
+            self._number_of_edges = number_of_edges
+
     def remove_node(self, label):
         """Remove a node grom the graph.
 
@@ -289,15 +604,16 @@ class UndirectedGraph(_Graph):
 
         """
         try:
-            neighbors = self.adj[label]
+            neighbors = self.adj.pop(label)
         except KeyError:
             raise DoesNotExistError(f'The node "{label}" does not exist.')
 
-        for neighbor in self.adj[label]:
-            self.adj[neighbor].discard(label)
-            self._number_of_edges -= 1
+        self._csr = None
+        adj = self.adj
+        for neighbor in neighbors:
+            adj[neighbor].pop(label, None)
 
-        del self.adj[label]
+        self._number_of_edges -= len(neighbors)
 
     def remove_edge(self, u_label, v_label):
         """Remove the edge from the graph.
@@ -317,13 +633,15 @@ class UndirectedGraph(_Graph):
             If the edge is not in the graph.
 
         """
-        if (u_label, v_label) not in self.edges:
+        neighbors_u = self.adj.get(u_label)
+        if neighbors_u is None or v_label not in neighbors_u:
             raise DoesNotExistError(
                 f'The edge "({u_label}, {v_label})" does not exist.'
             )
 
-        self.adj[u_label].discard(v_label)
-        self.adj[v_label].discard(u_label)
+        self._csr = None
+        neighbors_u.pop(v_label, None)
+        self.adj[v_label].pop(u_label, None)
         self._number_of_edges -= 1
 
     def neighbors(self, label):
@@ -336,23 +654,82 @@ class UndirectedGraph(_Graph):
 
         Returns
         -------
-        set
-            The neighbors as a Python set. This set should not be modified.
+        dict_keys
+            A read-only view of the neighbors. It supports iteration, ``len``,
+            membership queries and set operations such as ``&``, and it
+            reflects later changes to the graph.
 
         Note
         ----
-        Since the return value is a set, there is no guarantee about the orders
-        of the neighbors.
+        The neighbors are listed in the order in which their edges were added.
+
+        """
+        return self.adj[label].keys()
+
+    def neighborhood_intersection_size(self, u_label, v_label):
+        """The number of nodes adjacent to both of the given nodes.
+
+        This is the size of the intersection of the two nodes' neighborhoods,
+        the quantity at the heart of triangle counting: the number of
+        triangles containing the edge (u, v) is exactly this count.
+
+        Average case time complexity: Theta(min(# of neighbors of u, # of
+        neighbors of v))
+
+        Parameters
+        ----------
+        u_label
+            The label of one of the nodes.
+        v_label
+            The label of the other node.
+
+        Example
+        -------
+        >>> graph = UndirectedGraph()
+        >>> for u, v in [(1, 2), (1, 3), (2, 3), (2, 4), (3, 4)]:
+        ...     graph.add_edge(u, v)
+        >>> graph.neighborhood_intersection_size(2, 3)
+        2
 
         """
-        return self.adj[label]
+        neighbors_u = self.adj[u_label]
+        neighbors_v = self.adj[v_label]
+        if len(neighbors_u) > len(neighbors_v):
+            neighbors_u, neighbors_v = neighbors_v, neighbors_u
+
+        # scan the smaller neighborhood only. intersecting the keys views
+        # would copy the first operand into a set on Python < 3.9
+        return sum(map(neighbors_v.__contains__, neighbors_u))
 
 
 class DirectedGraph(_Graph):
+    __slots__ = ("back_adj",)
+
+    _state_attributes = _Graph._state_attributes + ("back_adj",)
+
     def __init__(self, _edge_view_factory=_DirectedEdgeView):
         super().__init__(_edge_view_factory)
         self.back_adj = dict()
 
+    def add_node(self, label):
+        """
+        Add a node with the given label.
+
+        If the node already exists, nothing is done.
+
+        Average case time complexity: Theta(1).
+
+        Parameters
+        ----------
+        label
+            The label of the node.
+
+        """
+        if label not in self.adj:
+            self._csr = None
+            self.adj[label] = {}
+            self.back_adj[label] = {}
+
     def add_edge(self, u_label, v_label):
         """Add a directed edge to the graph.
 
@@ -372,21 +749,77 @@ class DirectedGraph(_Graph):
         If either of the nodes is not in the graph, the node is created.
 
         """
-        for x in {u_label, v_label}:
+        successors = self.adj.get(u_label)
+        if successors is None:
+            successors = self.adj[u_label] = {}
+            self.back_adj[u_label] = {}
+
+        # the child's maps are only needed if the edge is new, which is the
+        # common case; if the edge exists, the child exists too. a new parent
+        # has no successors, so creating it always leads here as well
+        if v_label not in successors:
+            self._csr = None
+            predecessors = self.back_adj.get(v_label)
+            if predecessors is None:
+                self.adj[v_label] = {}
+                predecessors = self.back_adj[v_label] = {}
+
+            successors[v_label] = None
+            predecessors[u_label] = None
+            self._number_of_edges += 1
+
+    def add_edges_from(self, edges):
+        """Add several directed edges to the graph at once.
+
+        Equivalent to calling :meth:`add_edge` on each pair, but faster when
+        loading many edges.
+
+        Average case time complexity: Theta(# of edges given).
+
+        Parameters
+        ----------
+        edges
+            An iterable of (parent, child) pairs of node labels.
 
-            if x not in self.adj:
-                self.adj[x] = set()
-            if x not in self.back_adj:
-                self.back_adj[x] = set()
+        Example
+        -------
+        >>> graph = DirectedGraph()
+        >>> graph.add_edges_from([(1, 2), (2, 1), (2, 2)])
+        >>> len(graph.edges)
+        3
 
-        self.adj[u_label].add(v_label)
-        self.back_adj[v_label].add(u_label)
-        self._number_of_edges += 1
+        """
+        adj = self.adj
+        back_adj = self.back_adj
+        number_of_edges = self._number_of_edges
+
+        try:
+            for u_label, v_label in edges:
+                successors = adj.get(u_label)
+                if successors is None:
+                    successors = adj[u_label] = {}
+                    back_adj[u_label] = {}
+
+                if v_label not in successors:
+                    predecessors = back_adj.get(v_label)
+                    if predecessors is None:
+                        adj[v_label] = {}
+                        predecessors = back_adj[v_label] = {}
+
+                    successors[v_label] = None
+                    predecessors[u_label] = None
+                    number_of_edges += 1
+        finally:
+            # nodes are only created together with new edges, so the graph
+            # changed exactly when the edge count did
+            if number_of_edges != self._number_of_edges:
+                self._csr = None
+            self._number_of_edges = number_of_edges
 
     def remove_node(self, label):
         """Remove a node grom the graph.
 
-        Average case time complexity: Theta(# of predecessors)
+        Average case time complexity: Theta(# of predecessors + # of successors)
         
         Parameters
         ----------
@@ -399,21 +832,29 @@ class DirectedGraph(_Graph):
             If the node is not in the graph.
 
         """
-        if label not in self.nodes:
+        try:
+            successors = self.adj.pop(label)
+        except KeyError:
             raise DoesNotExistError(f'The node "{label}" does not exist.')
 
-        # in case there is a self-loop, since we can't modify set while iterating
-        if label in self.back_adj[label]:
-            self.adj[label].discard(label)
-            self.back_adj[label].discard(label)
-            self._number_of_edges -= 1
+        self._csr = None
+        predecessors = self.back_adj.pop(label)
 
-        for parent in self.back_adj[label]:
-            self.adj[parent].discard(label)
+        # a self-loop is both a successor and a predecessor, but is one edge
+        if label in successors:
+            successors.pop(label, None)
+            predecessors.pop(label, None)
             self._number_of_edges -= 1
 
-        self._number_of_edges -= len(self.adj[label])
-        del self.adj[label]
+        adj = self.adj
+        for parent in predecessors:
+            adj[parent].pop(label, None)
+
+        back_adj = self.back_adj
+        for child in successors:
+            back_adj[child].pop(label, None)
+
+        self._number_of_edges -= len(predecessors) + len(successors)
 
     def remove_edge(self, u_label, v_label):
         """Remove the edge from the graph.
@@ -433,13 +874,15 @@ class DirectedGraph(_Graph):
             If the edge is not in the graph.
 
         """
-        if (u_label, v_label) not in self.edges:
+        successors = self.adj.get(u_label)
+        if successors is None or v_label not in successors:
             raise DoesNotExistError(
                 f'The edge "({u_label}, {v_label})" does not exist.'
             )
 
-        self.adj[u_label].discard(v_label)
-        self.back_adj[v_label].discard(u_label)
+        self._csr = None
+        successors.pop(v_label, None)
+        self.back_adj[v_label].pop(u_label, None)
         self._number_of_edges -= 1
 
     def predecessors(self, label):
@@ -452,17 +895,17 @@ class DirectedGraph(_Graph):
 
         Returns
         -------
-        set
-            The predecessors as a Python set. This set should not be modified.
+        dict_keys
+            A read-only view of the predecessors. It supports iteration, ``len``,
+            membership queries and set operations such as ``&``, and it
+            reflects later changes to the graph.
 
         Note
         ----
-        Since the return value is a set, there is no guarantee about the orders
-        of the neighbors.
-
+        The predecessors are listed in the order in which their edges were added.
 
         """
-        return self.back_adj[label]
+        return self.back_adj[label].keys()
 
     def successors(self, label):
         """The successors of the node.
@@ -474,17 +917,250 @@ class DirectedGraph(_Graph):
 
         Returns
         -------
-        set
-            The successors as a Python set. This set should not be modified.
+        dict_keys
+            A read-only view of the successors. It supports iteration, ``len``,
+            membership queries and set operations such as ``&``, and it
+            reflects later changes to the graph.
 
         Note
         ----
-        Since the return value is a set, there is no guarantee about the orders
-        of the neighbors.
+        The successors are listed in the order in which their edges were added.
 
         """
-        return self.adj[label]
+        return self.adj[label].keys()
 
     def neighbors(self, label):
         """Alias of successors. Provided for convenience."""
         return self.successors(label)
+
+
+class UndirectedIntGraph(_Graph):
+    """An undirected graph on integer nodes, stored as bitsets.
+
+    The node labels must be non-negative integers. The neighbors of node u are
+    stored as a single Python integer whose bit v is set when u and v are
+    adjacent. For dense graphs on up to several thousand nodes this takes far
+    less memory than a hash table of neighbors per node, and edge queries are a
+    shift and a bitwise AND.
+
+    This class has the same methods as :class:`UndirectedGraph`, with two
+    differences: node labels must be non-negative integers, and
+    :meth:`neighbors` returns a new list rather than a set-like view, so
+    membership queries on its result take time linear in the node's degree.
+    Because Python integers are immutable, adding or removing an edge builds
+    new bitsets, taking time proportional to the largest label divided by the
+    machine word size.
+
+    """
+
+    __slots__ = ()
+
+    def __init__(self, _edge_view_factory=_UndirectedIntEdgeView):
+        super().__init__(_edge_view_factory)
+
+    @staticmethod
+    def _normalize_label(label):
+        # accept anything usable as an index, such as NumPy integers, but
+        # store it as a plain int so that shifts are done on Python integers
+        try:
+            label = operator.index(label)
+        except TypeError:
+            raise TypeError(f"Node labels must be integers, not {label!r}.") from None
+        if label < 0:
+            raise ValueError(f"Node labels must be non-negative, not {label}.")
+        return label
+
+    def add_node(self, label):
+        """
+        Add a node with the given label.
+
+        If the node already exists, nothing is done.
+
+        Parameters
+        ----------
+        label : int
+            The label of the node. Must be non-negative.
+
+        Raises
+        ------
+        TypeError
+            If the label is not an integer.
+        ValueError
+            If the label is negative.
+
+        """
+        label = self._normalize_label(label)
+        if label not in self.adj:
+            self._csr = None
+            self.adj[label] = 0
+
+    def add_edge(self, u_label, v_label):
+        """Add an undirected edge to the graph.
+
+        If the edge already exists, nothing is done.
+
+        Parameters
+        ----------
+        u_label : int
+            Label of one of the nodes in the edge.
+        v_label : int
+            Label of the other node in the edge.
+
+        Notes
+        -----
+        If either of the nodes is not in the graph, the node is created.
+
+        Raises
+        ------
+        TypeError
+            If either label is not an integer.
+        ValueError
+            If either label is negative, or if an attempt to add a self-loop
+            is made.
+
+        """
+        u_label = self._normalize_label(u_label)
+        v_label = self._normalize_label(v_label)
+        if u_label == v_label:
+            raise ValueError("Undirected graphs have no self loops.")
+
+        adj = self.adj
+        mask_u = adj.get(u_label, 0)
+        if not (mask_u >> v_label) & 1:
+            self._csr = None
+            adj[u_label] = mask_u | (1 << v_label)
+            adj[v_label] = adj.get(v_label, 0) | (1 << u_label)
+            self._number_of_edges += 1
+
+    def add_edges_from(self, edges):
+        """Add several undirected edges to the graph at once.
+
+        Equivalent to calling :meth:`add_edge` on each pair, but faster when
+        loading many edges.
+
+        Parameters
+        ----------
+        edges
+            An iterable of pairs of integer node labels.
+
+        Raises
+        ------
+        TypeError
+            If a label is not an integer.
+        ValueError
+            If a label is negative, or if one of the edges is a self-loop. The
+            edges before it will have been added.
+
+        """
+        adj = self.adj
+        normalize_label = self._normalize_label
+        number_of_edges = self._number_of_edges
+
+        try:
+            for u_label, v_label in edges:
+                u_label = normalize_label(u_label)
+                v_label = normalize_label(v_label)
+                if u_label == v_label:
+                    raise ValueError("Undirected graphs have no self loops.")
+
+                mask_u = adj.get(u_label, 0)
+                if not (mask_u >> v_label) & 1:
+                    adj[u_label] = mask_u | (1 << v_label)
+                    adj[v_label] = adj.get(v_label, 0) | (1 << u_label)
+                    number_of_edges += 1
+        finally:
+            # nodes are only created together with new edges, so the graph
+            # changed exactly when the edge count did
+            if number_of_edges != self._number_of_edges:
+                self._csr = None
+            self._number_of_edges = number_of_edges
+
+    def remove_node(self, label):
+        """Remove a node from the graph.
+
+        Parameters
+        ----------
+        label : int
+            The label of the node to be removed.
+
+        Raises
+        ------
+        DoesNotExistError
+            If the node is not in the graph.
+
+        """
+        try:
+            mask = self.adj.pop(label)
+        except KeyError:
+            raise DoesNotExistError(f'The node "{label}" does not exist.')
+
+        self._csr = None
+        adj = self.adj
+        keep = ~(1 << operator.index(label))
+        for neighbor in _iter_bits(mask):
+            adj[neighbor] &= keep
+
+        self._number_of_edges -= _bit_count(mask)
+
+    def remove_edge(self, u_label, v_label):
+        """Remove the edge from the graph.
+
+        Parameters
+        ----------
+        u_label : int
+            The label of one of the nodes in the edge.
+        v_label : int
+            The label of the other node.
+
+        Raises
+        ------
+        DoesNotExistError
+            If the edge is not in the graph.
+
+        """
+        if (u_label, v_label) not in self.edges:
+            raise DoesNotExistError(
+                f'The edge "({u_label}, {v_label})" does not exist.'
+            )
+
+        self._csr = None
+        u_label = operator.index(u_label)
+        v_label = operator.index(v_label)
+        self.adj[u_label] &= ~(1 << v_label)
+        self.adj[v_label] &= ~(1 << u_label)
+        self._number_of_edges -= 1
+
+    def neighbors(self, label):
+        """The neighbors of the node.
+
+        Parameters
+        ----------
+        label : int
+            The label of the node whose neighbors should be retrieved.
+
+        Returns
+        -------
+        list
+            The neighbors, in increasing order, as a new list. Unlike the
+            result of :meth:`UndirectedGraph.neighbors`, this is not a view:
+            it does not support set operations, and ``in`` takes time linear
+            in its length. Use :attr:`edges` for constant time edge queries.
+
+        """
+        return list(_iter_bits(self.adj[label]))
+
+    def neighborhood_intersection_size(self, u_label, v_label):
+        """The number of nodes adjacent to both of the given nodes.
+
+        Computed as a bitwise AND of the two bitsets followed by a count of
+        the set bits, with no Python-level loop.
+
+        Parameters
+        ----------
+        u_label : int
+            The label of one of the nodes.
+        v_label : int
+            The label of the other node.
+
+        """
+        return _bit_count(self.adj[u_label] & self.adj[v_label])
@@ -1,4 +1,14 @@
-from dsc40graph import UndirectedGraph, DirectedGraph, DoesNotExistError
+from dsc40graph import (
+    UndirectedGraph,
+    DirectedGraph,
+    UndirectedIntGraph,
+    DoesNotExistError,
+)
+
+import copy
+import operator
+import pickle
+import weakref
 
 import pytest
 
@@ -314,3 +324,528 @@ def test_arbitrary_node_raises_if_graph_empty():
     g = UndirectedGraph()
     with pytest.raises(DoesNotExistError):
         u = g.arbitrary_node()
+
+
+def test_undirected_edges_yields_each_edge_once():
+    # given
+    g = UndirectedGraph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.add_edge("a", 1)
+    g.add_edge(-1, -2)
+
+    # when
+    edges = list(g.edges)
+
+    # then
+    assert len(edges) == 4
+    assert {frozenset(e) for e in edges} == {
+        frozenset((1, 2)),
+        frozenset((2, 3)),
+        frozenset(("a", 1)),
+        frozenset((-1, -2)),
+    }
+
+
+def test_edges_view_reflects_later_changes():
+    # given
+    g = DirectedGraph()
+    edges = g.edges
+    nodes = g.nodes
+
+    # when
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    # then
+    assert len(edges) == 2
+    assert (2, 3) in edges
+    assert len(nodes) == 3
+
+
+def test_directed_add_edge_twice_only_adds_one_edge():
+    # given
+    g = DirectedGraph()
+
+    # when
+    g.add_edge(1, 3)
+    g.add_edge(1, 3)
+    g.add_edge(2, 2)
+    g.add_edge(2, 2)
+
+    # then
+    assert len(g.edges) == 2
+    assert set(g.edges) == {(1, 3), (2, 2)}
+
+
+def test_directed_add_edge_to_existing_node_keeps_its_edges():
+    # given
+    g = DirectedGraph()
+    g.add_node(1)
+    g.add_node(2)
+    g.add_edge(2, 3)
+
+    # when
+    g.add_edge(1, 2)
+
+    # then
+    assert set(g.edges) == {(1, 2), (2, 3)}
+    assert set(g.predecessors(1)) == set()
+    assert set(g.predecessors(2)) == {1}
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, DirectedGraph])
+def test_frozen_graph_iterates_same_edges(cls):
+    # given
+    g = cls()
+    for u, v in [(1, 2), (2, 3), (3, 1), (1, 4), ("a", 2), (-1, -2)]:
+        g.add_edge(u, v)
+    g.add_node(5)
+    expected = set(map(frozenset, g.edges))
+
+    # when
+    g.freeze()
+
+    # then
+    edges = list(g.edges)
+    assert len(edges) == len(g.edges)
+    assert set(map(frozenset, edges)) == expected
+
+
+def test_directed_frozen_graph_keeps_edge_orientation():
+    # given
+    g = DirectedGraph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 1)
+    g.add_edge(3, 3)
+
+    # when
+    g.freeze()
+
+    # then
+    assert sorted(g.edges) == [(1, 2), (2, 1), (3, 3)]
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, DirectedGraph])
+def test_modifying_frozen_graph_updates_edges(cls):
+    # given
+    g = cls()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.freeze()
+
+    # when
+    g.add_edge(3, 4)
+    g.remove_edge(1, 2)
+
+    # then
+    assert {frozenset(e) for e in g.edges} == {frozenset((2, 3)), frozenset((3, 4))}
+
+
+def test_undirected_add_edges_from():
+    # given
+    g = UndirectedGraph()
+    g.add_edge(1, 2)
+
+    # when
+    g.add_edges_from([(2, 1), (2, 3), (3, 4), (4, 3)])
+
+    # then
+    assert len(g.edges) == 3
+    assert set(g.neighbors(3)) == {2, 4}
+
+
+def test_undirected_add_edges_from_self_loop_keeps_earlier_edges():
+    # given
+    g = UndirectedGraph()
+
+    # when
+    with pytest.raises(ValueError):
+        g.add_edges_from([(1, 2), (2, 3), (3, 3), (3, 4)])
+
+    # then
+    assert len(g.edges) == 2
+    assert {frozenset(e) for e in g.edges} == {frozenset((1, 2)), frozenset((2, 3))}
+
+
+def test_directed_add_edges_from():
+    # given
+    g = DirectedGraph()
+    g.add_node(2)
+    g.add_edge(1, 2)
+
+    # when
+    g.add_edges_from([(1, 2), (2, 1), (2, 2), (3, 2)])
+
+    # then
+    assert len(g.edges) == 4
+    assert set(g.predecessors(2)) == {1, 2, 3}
+    assert set(g.successors(3)) == {2}
+
+
+def test_directed_to_csr():
+    np = pytest.importorskip("numpy")
+
+    # given
+    g = DirectedGraph()
+    g.add_edge("a", "c")
+    g.add_edge("a", "b")
+    g.add_edge("c", "a")
+    g.add_node("d")
+
+    # when
+    nodes, indptr, indices = g.to_csr()
+
+    # then
+    assert nodes == ["a", "c", "b", "d"]
+    assert indptr.dtype == np.int64
+    assert indptr.tolist() == [0, 2, 3, 3, 3]
+    assert indices.tolist() == [1, 2, 0]
+
+
+def test_undirected_to_csr_with_node_order():
+    pytest.importorskip("numpy")
+
+    # given
+    g = UndirectedGraph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    # when
+    nodes, indptr, indices = g.to_csr(node_order=[3, 2, 1])
+
+    # then
+    assert nodes == [3, 2, 1]
+    assert indptr.tolist() == [0, 1, 3, 4]
+    assert indices.tolist() == [1, 0, 2, 1]
+
+
+def test_to_csr_rejects_bad_node_order():
+    pytest.importorskip("numpy")
+
+    # given
+    g = UndirectedGraph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    # when
+    with pytest.raises(ValueError):
+        g.to_csr(node_order=[1, 2, 2])
+
+
+def test_remove_node_removes_it_from_predecessors_directed():
+    # given
+    g = DirectedGraph()
+    g.add_edge(1, 2)
+    g.add_edge(1, 3)
+    g.add_edge(3, 1)
+    g.add_edge(1, 1)
+
+    # when
+    g.remove_node(1)
+
+    # then
+    assert set(g.predecessors(2)) == set()
+    assert set(g.predecessors(3)) == set()
+    assert set(g.successors(3)) == set()
+    assert len(g.edges) == 0
+
+    # re-adding the node does not bring back its old edges
+    g.add_node(1)
+    assert set(g.predecessors(1)) == set()
+    assert set(g.successors(1)) == set()
+
+
+def test_int_graph_add_edge_and_query():
+    # given
+    g = UndirectedIntGraph()
+
+    # when
+    g.add_edge(1, 3)
+    g.add_edge(3, 1)
+    g.add_edge(5, 1)
+    g.add_node(7)
+
+    # then
+    assert set(g.nodes) == {1, 3, 5, 7}
+    assert len(g.edges) == 2
+    assert (1, 3) in g.edges
+    assert (3, 1) in g.edges
+    assert (1, 7) not in g.edges
+    assert (1, "a") not in g.edges
+    assert (1, -1) not in g.edges
+    assert g.neighbors(1) == [3, 5]
+
+
+def test_int_graph_edges_yields_each_edge_once():
+    # given
+    g = UndirectedIntGraph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 100)]:
+        g.add_edge(u, v)
+
+    # when
+    edges = list(g.edges)
+
+    # then
+    assert sorted(edges) == [(0, 1), (0, 2), (1, 2), (2, 100)]
+
+    g.freeze()
+    assert sorted(map(sorted, g.edges)) == [[0, 1], [0, 2], [1, 2], [2, 100]]
+
+
+def test_int_graph_remove_node_and_edge():
+    # given
+    g = UndirectedIntGraph()
+    for u, v in [(0, 1), (1, 2), (2, 0), (2, 3)]:
+        g.add_edge(u, v)
+
+    # when
+    g.remove_node(2)
+    g.remove_edge(1, 0)
+
+    # then
+    assert set(g.nodes) == {0, 1, 3}
+    assert len(g.edges) == 0
+    assert g.neighbors(3) == []
+
+    with pytest.raises(DoesNotExistError):
+        g.remove_edge(0, 1)
+
+    with pytest.raises(DoesNotExistError):
+        g.remove_node(2)
+
+
+def test_int_graph_rejects_bad_labels():
+    # given
+    g = UndirectedIntGraph()
+
+    # when
+    with pytest.raises(TypeError):
+        g.add_node("a")
+
+    with pytest.raises(ValueError):
+        g.add_edge(1, -1)
+
+    with pytest.raises(ValueError):
+        g.add_edge(1, 1)
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, UndirectedIntGraph])
+def test_neighborhood_intersection_size(cls):
+    # given
+    g = cls()
+    for u, v in [(1, 2), (1, 3), (2, 3), (2, 4), (3, 4), (4, 5)]:
+        g.add_edge(u, v)
+
+    # then
+    assert g.neighborhood_intersection_size(2, 3) == 2
+    assert g.neighborhood_intersection_size(1, 4) == 2
+    assert g.neighborhood_intersection_size(1, 5) == 0
+
+
+def test_neighbors_are_in_insertion_order():
+    # given
+    g = DirectedGraph()
+
+    # when
+    for v in [5, 3, 9, 1]:
+        g.add_edge(0, v)
+        g.add_edge(v, 7)
+
+    g.remove_edge(0, 3)
+    g.add_edge(0, 3)
+
+    # then
+    assert list(g.successors(0)) == [5, 9, 1, 3]
+    assert list(g.predecessors(7)) == [5, 3, 9, 1]
+
+
+def test_nodes_iterator_knows_its_length():
+    # given
+    g = UndirectedGraph()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    # then
+    assert type(iter(g.nodes)) is type(iter({}))
+    assert operator.length_hint(iter(g.nodes)) == 3
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, DirectedGraph, UndirectedIntGraph])
+def test_deepcopy_round_trip(cls):
+    # given
+    g = cls()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+
+    # when
+    h = copy.deepcopy(g)
+    h.add_edge(3, 4)
+
+    # then
+    assert len(g.edges) == 2
+    assert len(h.edges) == 3
+    assert (3, 4) not in g.edges
+    assert (3, 4) in h.edges
+    assert set(h.nodes) == {1, 2, 3, 4}
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, DirectedGraph, UndirectedIntGraph])
+def test_pickle_round_trip(cls):
+    # given
+    g = cls()
+    g.add_edge(1, 2)
+    g.add_edge(2, 3)
+    g.freeze()
+
+    # when
+    h = pickle.loads(pickle.dumps(g))
+
+    # then
+    assert type(h) is cls
+    assert set(h.nodes) == {1, 2, 3}
+    assert {frozenset(e) for e in h.edges} == {frozenset((1, 2)), frozenset((2, 3))}
+
+    h.add_edge(3, 4)
+    assert len(h.edges) == 3
+    assert len(g.edges) == 2
+
+
+def test_copy_gets_its_own_views():
+    # given
+    g = UndirectedGraph()
+    g.add_edge(1, 2)
+
+    # when
+    h = copy.copy(g)
+    h.add_edge(2, 3)
+
+    # then
+    assert h.edges._graph is h
+    assert len(h.edges) == 2
+
+
+def test_undirected_edge_order_does_not_depend_on_hash_seed():
+    # given
+    g = UndirectedGraph()
+
+    # when
+    for u, v in [("a", "b"), ("b", "c"), ("c", "d"), ("a", "d")]:
+        g.add_edge(u, v)
+
+    # then
+    assert list(g.edges) == [("a", "b"), ("a", "d"), ("b", "c"), ("c", "d")]
+
+
+def test_int_graph_add_edges_from():
+    # given
+    g = UndirectedIntGraph()
+    g.add_edge(0, 1)
+
+    # when
+    with pytest.raises(ValueError):
+        g.add_edges_from([(1, 0), (1, 2), (2, 3), (3, 3), (3, 4)])
+
+    # then
+    assert len(g.edges) == 3
+    assert sorted(map(sorted, g.edges)) == [[0, 1], [1, 2], [2, 3]]
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, DirectedGraph, UndirectedIntGraph])
+def test_graphs_support_weak_references(cls):
+    # given
+    g = cls()
+
+    # when
+    ref = weakref.ref(g)
+
+    # then
+    assert ref() is g
+
+
+class _CountingLabel:
+    """A node label that counts how often it is hashed."""
+
+    hashes = 0
+
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        _CountingLabel.hashes += 1
+        return hash(self.value)
+
+    def __eq__(self, other):
+        return isinstance(other, _CountingLabel) and self.value == other.value
+
+
+def test_undirected_first_edge_does_not_visit_every_node():
+    # given
+    g = UndirectedGraph()
+    labels = [_CountingLabel(i) for i in range(1000)]
+    for u, v in zip(labels, labels[1:]):
+        g.add_edge(u, v)
+
+    # when
+    _CountingLabel.hashes = 0
+    u, v = next(iter(g.edges))
+
+    # then
+    assert {u.value, v.value} == {0, 1}
+    assert _CountingLabel.hashes < 10
+
+
+@pytest.mark.parametrize("cls", [UndirectedGraph, DirectedGraph, UndirectedIntGraph])
+def test_no_op_changes_keep_frozen_snapshot(cls):
+    # given
+    g = cls()
+    g.add_edge(1, 2)
+    g.add_node(3)
+    g.freeze()
+    snapshot = g._csr
+
+    # when
+    g.add_node(1)
+    g.add_node(3)
+    g.add_edge(1, 2)
+    g.add_edges_from([(1, 2)])
+
+    # then
+    assert g._csr is snapshot
+
+    g.add_edge(2, 3)
+    assert g._csr is None
+
+
+def test_int_graph_accepts_numpy_integers():
+    np = pytest.importorskip("numpy")
+
+    # given
+    g = UndirectedIntGraph()
+
+    # when
+    g.add_edge(np.int64(1), np.int64(100))
+    g.add_edges_from([(np.int32(100), np.int64(2))])
+    g.add_node(np.int64(7))
+
+    # then
+    assert set(g.nodes) == {1, 2, 7, 100}
+    assert all(type(node) is int for node in g.nodes)
+    assert (np.int64(100), np.int64(1)) in g.edges
+    assert g.neighbors(100) == [1, 2]
+
+    g.remove_edge(np.int64(1), np.int64(100))
+    g.remove_node(np.int64(2))
+    assert len(g.edges) == 0
+
+
+def test_int_graph_treats_bools_as_integers():
+    # given
+    g = UndirectedIntGraph()
+
+    # when
+    g.add_edge(True, 5)
+
+    # then
+    assert type(next(iter(g.nodes))) is int
+    assert (1, 5) in g.edges